@@ -17,8 +17,7 @@ def load():
     # perform the actual load
     print("Will load the data")
     con.execute(open("create.sql").read())
-    con.execute("CREATE TABLE new_tbl AS SELECT * FROM read_csv('hits.tsv.gz') LIMIT 65536;")
-    con.execute("COPY new_tbl TO 'hits/hits.csv' (HEADER  false, DELIMITER '|');")
+    con.execute("COPY (SELECT * FROM read_csv('hits.tsv.gz') LIMIT 65536) TO 'hits/hits.csv' (HEADER false, DELIMITER '|');")
 
 
 if __name__ == '__main__':